@@ -1,104 +1,163 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
 import json
-from typing import List
-
-import requests
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 from .models import MediaItem
-from .utils import ANILIST_GQL, COUNTRY_MAP, clean_text
+from .utils import clean_text, lookup_country, user_cache_dir, yyyymmdd_int
+
+
+# Hot names are bound as default arguments so each call reads them as locals.
+def _build_item(
+    m: dict, media_type: str,
+    _MediaItem=MediaItem, _country=lookup_country, _clean=clean_text, _date=dt.date,
+) -> MediaItem:
+    title_block = m.get("title") or {}
+    title = title_block.get("english") or title_block.get("romaji") or "Untitled"
+    title_native = title_block.get("native") or ""
+
+    cover = m.get("coverImage") or {}
+    image_url = cover.get("large") or cover.get("medium") or ""
+    image_url_thumb = cover.get("medium") or image_url
+
+    cc = m.get("countryOfOrigin") or ""
+    country, language = _country(cc)
+
+    sd = m.get("startDate") or {}
+    y, mo, d = sd.get("year"), sd.get("month"), sd.get("day")
+    start_date = None
+    if y and mo and d:
+        try:
+            start_date = _date(y, mo, d)
+        except ValueError:
+            pass
+
+    return _MediaItem(
+        id=m["id"],
+        media_type=media_type,
+        title=title,
+        title_native=title_native,
+        image_url=image_url,
+        image_url_thumb=image_url_thumb,
+        country_code=cc,
+        country=country,
+        language=language,
+        start_date=start_date,
+        format=m.get("format") or "Unknown",
+        status=m.get("status") or "Unknown",
+        description=_clean(m.get("description")),
+        site_url=m.get("siteUrl") or "",
+    )
 
 
 class AniListClient:
     QUERY = """
-    query ($type: MediaType, $startGreater: FuzzyDateInt, $startLesser: FuzzyDateInt, $perPage: Int) {
-      Page(page: 1, perPage: $perPage) {
-        media(type: $type, startDate_greater: $startGreater, startDate_lesser: $startLesser, sort: START_DATE_DESC) {
-          id
-          type
-          format
-          status
-          title { romaji english native }
-          startDate { year month day }
-          countryOfOrigin
-          description(asHtml: false)
-          siteUrl
-          coverImage { large medium color }
+    query ($startGreater: FuzzyDateInt, $startLesser: FuzzyDateInt, $perPage: Int) {
+      anime: Page(page: 1, perPage: $perPage) {
+        media(type: ANIME, startDate_greater: $startGreater, startDate_lesser: $startLesser, sort: START_DATE_DESC) {
+          ...MediaFields
+        }
+      }
+      manga: Page(page: 1, perPage: $perPage) {
+        media(type: MANGA, startDate_greater: $startGreater, startDate_lesser: $startLesser, sort: START_DATE_DESC) {
+          ...MediaFields
         }
       }
     }
+
+    fragment MediaFields on Media {
+      id
+      format
+      status
+      title { romaji english native }
+      startDate { year month day }
+      countryOfOrigin
+      description(asHtml: false)
+      siteUrl
+      coverImage { large medium }
+    }
     """
+    # GraphQL ignores insignificant whitespace and the query has no string
+    # literals, so the indentation is collapsed once instead of sent on every post.
+    _QUERY_JSON = json.dumps(" ".join(QUERY.split())).encode("utf-8")
+
+    HEADERS = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "User-Agent": "MiniAniManga/1.0 (PySide6; personal use)",
+    }
+
+    CACHE_TTL_PAST = dt.timedelta(days=7)
+    CACHE_TTL_RECENT = dt.timedelta(hours=1)
 
-    def __init__(self, timeout: int = 25):
+    def __init__(self, timeout: int = 25, cache_dir: Optional[Path] = None):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "User-Agent": "MiniAniManga/1.0 (PySide6; personal use)",
-        })
-
-    def fetch_new(self, media_type: str, date_from: dt.date, date_to: dt.date, per_page: int = 35) -> List["MediaItem"]:
-        start_greater = date_from.year * 10000 + date_from.month * 100 + date_from.day
-        start_lesser  = date_to.year * 10000 + date_to.month * 100 + date_to.day
-
-        payload = {
-            "query": self.QUERY,
-            "variables": {
-                "type": media_type,
-                "startGreater": start_greater,
-                "startLesser": start_lesser,
-                "perPage": per_page,
-            },
-        }
+        self.cache_dir = cache_dir if cache_dir is not None else user_cache_dir()
 
-        r = self.session.post(ANILIST_GQL, json=payload, timeout=self.timeout)
-        if r.status_code != 200:
-            raise RuntimeError(f"HTTP {r.status_code}\n\n{r.text[:2000]}")
-        data = r.json()
+    def build_payload(self, date_from: dt.date, date_to: dt.date, per_page: int = 35) -> bytes:
+        variables = {
+            "startGreater": yyyymmdd_int(date_from),
+            "startLesser": yyyymmdd_int(date_to),
+            "perPage": per_page,
+        }
+        # The query text never changes, so only the variables are serialized per call.
+        return (
+            b'{"query":' + self._QUERY_JSON
+            + b',"variables":' + json.dumps(variables, separators=(",", ":")).encode("utf-8")
+            + b"}"
+        )
+
+    @classmethod
+    def cache_ttl(cls, date_to: dt.date) -> Optional[dt.timedelta]:
+        # None means "don't use the cache": ranges that include today are
+        # always fetched fresh when the user clicks Download.
+        today = dt.date.today()
+        if date_to >= today:
+            return None
+        # Yesterday's releases can still be added or corrected upstream.
+        if date_to == today - dt.timedelta(days=1):
+            return cls.CACHE_TTL_RECENT
+        return cls.CACHE_TTL_PAST
+
+    def cache_path(self, payload: bytes) -> Path:
+        return self.cache_dir / f"anilist_{hashlib.sha1(payload).hexdigest()}.json"
+
+    def load_cached(self, payload: bytes, max_age: dt.timedelta) -> Optional[bytes]:
+        path = self.cache_path(payload)
+        try:
+            if time.time() - path.stat().st_mtime > max_age.total_seconds():
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def store_cached(self, payload: bytes, body: bytes):
+        path = self.cache_path(payload)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(body)
+            tmp.replace(path)
+        except OSError:
+            pass
+
+    def parse_response(self, status: int, body: bytes) -> Tuple[List[MediaItem], List[MediaItem]]:
+        if status != 200:
+            text = body.decode("utf-8", errors="replace")
+            raise RuntimeError(f"HTTP {status}\n\n{text[:2000]}")
+        data = json.loads(body)
         if data.get("errors"):
             raise RuntimeError("AniList GraphQL error:\n" + json.dumps(data["errors"], indent=2)[:2000])
 
-        media_list = (data.get("data") or {}).get("Page", {}).get("media", []) or []
-
-        out: List[MediaItem] = []
-        for m in media_list:
-            title_block = m.get("title") or {}
-            title = title_block.get("english") or title_block.get("romaji") or "Untitled"
-            title_native = title_block.get("native") or ""
-
-            cover = m.get("coverImage") or {}
-            image_url = cover.get("large") or cover.get("medium") or ""
-
-            cc = m.get("countryOfOrigin") or ""
-            country, language = COUNTRY_MAP.get(cc, (cc or "Unknown", "Unknown"))
-
-            sd = m.get("startDate") or {}
-            try:
-                if sd.get("year") and sd.get("month") and sd.get("day"):
-                    start_date = dt.date(int(sd["year"]), int(sd["month"]), int(sd["day"]))
-                else:
-                    start_date = None
-            except Exception:
-                start_date = None
-
-            out.append(
-                MediaItem(
-                    id=int(m.get("id") or 0),
-                    media_type=str(m.get("type") or media_type),
-                    title=str(title),
-                    title_native=str(title_native),
-                    image_url=str(image_url),
-                    country_code=str(cc),
-                    country=str(country),
-                    language=str(language),
-                    start_date=start_date,
-                    format=str(m.get("format") or "Unknown"),
-                    status=str(m.get("status") or "Unknown"),
-                    description=clean_text(m.get("description")),
-                    site_url=str(m.get("siteUrl") or ""),
-                )
-            )
-
-        return out
+        pages = data.get("data") or {}
+        anime = self._parse_media((pages.get("anime") or {}).get("media", []) or [], "ANIME")
+        manga = self._parse_media((pages.get("manga") or {}).get("media", []) or [], "MANGA")
+        return anime, manga
+
+    @staticmethod
+    def _parse_media(media_list: list, media_type: str) -> List[MediaItem]:
+        return [_build_item(m, media_type) for m in media_list]
@@ -1,33 +1,128 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Sequence, Set, Tuple
 
 from PySide6 import QtCore, QtGui, QtNetwork
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import Qt, QUrl
+
+from .utils import user_cache_dir
+
+
+class _DecodeSignals(QtCore.QObject):
+    decoded = QtCore.Signal(str, QtGui.QImage, list)  # url, full image, [QImage per size]
+
+
+class _DecodeJob(QtCore.QRunnable):
+    """Decodes cover bytes into a QImage on a pool thread.
+
+    QImage is reentrant, QPixmap is not, so only QImages are built here,
+    including the smooth-scaled variants for every size the cover was requested at.
+    The job owns its signal object, so a decode that finishes after the
+    ImageCache is gone has nothing to emit into.
+    """
+
+    def __init__(self, url: str, data: bytes, sizes: Sequence[QtCore.QSize] = ()):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.sizes = list(sizes)
+        self.signals = _DecodeSignals()
+
+    def run(self):
+        img = QtGui.QImage()
+        img.loadFromData(self.data)
+        scaled = []
+        if not img.isNull():
+            scaled = [img.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation) for size in self.sizes]
+        self.signals.decoded.emit(self.url, img, scaled)
 
 
 class ImageCache(QtCore.QObject):
     image_ready = QtCore.Signal(str)
 
-    def __init__(self):
+    SCALED_CAPACITY = 256
+    MAX_CONCURRENT = 6
+
+    def __init__(self, cache_limit_mb: int = 128, disk_cache_mb: int = 256):
         super().__init__()
         self._manager = QtNetwork.QNetworkAccessManager(self)
-        self._cache: Dict[str, QtGui.QPixmap] = {}
+        # AniList cover URLs are immutable, so keep downloads across launches.
+        disk_cache = QtNetwork.QNetworkDiskCache(self)
+        disk_cache.setCacheDirectory(str(user_cache_dir() / "covers"))
+        disk_cache.setMaximumCacheSize(disk_cache_mb * 1024 * 1024)
+        self._manager.setCache(disk_cache)
+        # Full-size covers live in QPixmapCache, which evicts least recently
+        # used entries once the budget (in KB) is exceeded.
+        QtGui.QPixmapCache.setCacheLimit(cache_limit_mb * 1024)
         self._pending: Dict[str, QtNetwork.QNetworkReply] = {}
+        self._queue: Deque[str] = deque()
+        self._scaled: "OrderedDict[Tuple[str, int, int], QtGui.QPixmap]" = OrderedDict()
+        self._decoding: Set[str] = set()
+        # Sizes each in-flight cover was requested at; only appended to, so
+        # a decode job's results line up with the list's prefix.
+        self._sizes: Dict[str, List[QtCore.QSize]] = {}
 
     def get(self, url: str) -> Optional[QtGui.QPixmap]:
         if not url:
             return None
-        return self._cache.get(url)
+        return QtGui.QPixmapCache.find(url)
+
+    def get_scaled(
+        self,
+        url: str,
+        size: QtCore.QSize,
+        mode: Qt.AspectRatioMode = Qt.KeepAspectRatioByExpanding,
+    ) -> Optional[QtGui.QPixmap]:
+        key = (url, size.width(), size.height())
+        pix = self._scaled.get(key)
+        if pix is not None:
+            self._scaled.move_to_end(key)
+            return pix
+
+        full = self.get(url)
+        if not full:
+            return None
+        pix = full.scaled(size, mode, Qt.SmoothTransformation)
+        self._store_scaled(key, pix)
+        return pix
+
+    def _store_scaled(self, key: Tuple[str, int, int], pix: QtGui.QPixmap):
+        self._scaled[key] = pix
+        self._scaled.move_to_end(key)
+        if len(self._scaled) > self.SCALED_CAPACITY:
+            self._scaled.popitem(last=False)
 
-    def request(self, url: str):
-        if not url or url in self._cache or url in self._pending:
+    def request(self, url: str, size: Optional[QtCore.QSize] = None):
+        """Fetch `url`; with `size`, the decode also pre-scales it to that size off the GUI thread."""
+        if not url:
+            return
+        busy = url in self._pending or url in self._decoding or url in self._queue
+        if not busy and self.get(url) is not None:
+            return
+        if size is not None:
+            sizes = self._sizes.setdefault(url, [])
+            if size not in sizes:
+                sizes.append(QtCore.QSize(size))
+        if busy:
+            return
+        if len(self._pending) >= self.MAX_CONCURRENT:
+            self._queue.append(url)
             return
+        self._start(url)
+
+    def _start(self, url: str):
         req = QtNetwork.QNetworkRequest(QUrl(url))
         req.setAttribute(
             QtNetwork.QNetworkRequest.RedirectPolicyAttribute,
             QtNetwork.QNetworkRequest.NoLessSafeRedirectPolicy,
         )
+        req.setAttribute(
+            QtNetwork.QNetworkRequest.CacheLoadControlAttribute,
+            QtNetwork.QNetworkRequest.PreferCache,
+        )
+        # Lets concurrent cover downloads share one multiplexed connection per host.
+        req.setAttribute(QtNetwork.QNetworkRequest.Http2AllowedAttribute, True)
         reply = self._manager.get(req)
         self._pending[url] = reply
         reply.finished.connect(lambda u=url: self._on_finished(u))
@@ -37,9 +132,29 @@ class ImageCache(QtCore.QObject):
         if not reply:
             return
         if reply.error() == QtNetwork.QNetworkReply.NetworkError.NoError:
-            data = reply.readAll()
-            pix = QtGui.QPixmap()
-            if pix.loadFromData(bytes(data)):
-                self._cache[url] = pix
-                self.image_ready.emit(url)
+            job = _DecodeJob(url, bytes(reply.readAll()), self._sizes.get(url, ()))
+            job.signals.decoded.connect(self._on_decoded)
+            self._decoding.add(url)
+            QtCore.QThreadPool.globalInstance().start(job)
+        else:
+            self._sizes.pop(url, None)
         reply.deleteLater()
+
+        while self._queue and len(self._pending) < self.MAX_CONCURRENT:
+            nxt = self._queue.popleft()
+            if self.get(nxt) is None:
+                self._start(nxt)
+            else:
+                self._sizes.pop(nxt, None)
+
+    @QtCore.Slot(str, QtGui.QImage, list)
+    def _on_decoded(self, url: str, img: QtGui.QImage, scaled: list):
+        self._decoding.discard(url)
+        sizes = self._sizes.pop(url, [])
+        if img.isNull():
+            return
+        QtGui.QPixmapCache.insert(url, QtGui.QPixmap.fromImage(img))
+        # Sizes added while the job ran fall through to get_scaled's lazy path.
+        for size, small in zip(sizes, scaled):
+            self._store_scaled((url, size.width(), size.height()), QtGui.QPixmap.fromImage(small))
+        self.image_ready.emit(url)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import datetime as dt
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
-@dataclass(frozen=True)
+_UNKNOWN_DATE = dt.date(1900, 1, 1)
+
+
+@dataclass(frozen=True, slots=True)
 class MediaItem:
     id: int
     media_type: str
     title: str
     title_native: str
     image_url: str
+    image_url_thumb: str
     country_code: str
     country: str
     language: str
@@ -19,6 +23,14 @@ class MediaItem:
     status: str
     description: str
     site_url: str
+    title_lc: str = field(init=False, repr=False, compare=False)
+    title_native_lc: str = field(init=False, repr=False, compare=False)
+    sort_key: Tuple[int, str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "title_lc", self.title.lower())
+        object.__setattr__(self, "title_native_lc", self.title_native.lower())
+        object.__setattr__(self, "sort_key", (self.key_date.toordinal(), self.media_type, self.title_lc))
 
     @property
     def publication_day(self) -> str:
@@ -26,4 +38,4 @@ class MediaItem:
 
     @property
     def key_date(self) -> dt.date:
-        return self.start_date if self.start_date else dt.date(1900, 1, 1)
+        return self.start_date if self.start_date else _UNKNOWN_DATE
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import datetime as dt
+import html
+import os
 import re
+from pathlib import Path
 from typing import Dict, Optional, Tuple
 
 ANILIST_GQL = "https://graphql.anilist.co"
@@ -28,6 +31,34 @@ COUNTRY_MAP: Dict[str, Tuple[str, str]] = {
     "VNM": ("Vietnam", "Vietnamese"),
 }
 
+_UNKNOWN = ("Unknown", "Unknown")
+# Fallback (country, language) pairs for codes missing from COUNTRY_MAP, built once per code.
+_FALLBACK: Dict[str, Tuple[str, str]] = {"": _UNKNOWN}
+
+# One scan for all markup: <br> -> newline, </p> -> blank line, other tags dropped.
+_RE_MARKUP = re.compile(r"(<br\s*/?>)|(</p\s*>)|<[^>]+>", re.IGNORECASE)
+_MARKUP_REPL = {1: "\n", 2: "\n\n", None: ""}
+_RE_NL = re.compile(r"\n{3,}")
+
+
+def _markup_repl(m: re.Match) -> str:
+    return _MARKUP_REPL[m.lastindex]
+
+
+def user_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "maapp"
+
+
+def lookup_country(cc: str) -> Tuple[str, str]:
+    hit = COUNTRY_MAP.get(cc)
+    if hit is not None:
+        return hit
+    hit = _FALLBACK.get(cc)
+    if hit is None:
+        hit = _FALLBACK[cc] = (cc or "Unknown", "Unknown")
+    return hit
+
 
 def yyyymmdd_int(d: dt.date) -> int:
     return d.year * 10000 + d.month * 100 + d.day
@@ -37,15 +68,7 @@ def clean_text(s: Optional[str]) -> str:
     if not s:
         return ""
     s = s.replace("\r", "")
-    s = re.sub(r"<br\s*/?>", "\n", s, flags=re.IGNORECASE)
-    s = re.sub(r"</p\s*>", "\n\n", s, flags=re.IGNORECASE)
-    s = re.sub(r"<[^>]+>", "", s)
-    s = (
-        s.replace("&amp;", "&")
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&quot;", '"')
-        .replace("&#039;", "'")
-    )
-    s = re.sub(r"\n{3,}", "\n\n", s).strip()
+    s = _RE_MARKUP.sub(_markup_repl, s)
+    s = html.unescape(s)
+    s = _RE_NL.sub("\n\n", s).strip()
     return s
\ No newline at end of file
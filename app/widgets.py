@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import functools
+from typing import Iterator, Optional
+
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
 
@@ -7,6 +10,47 @@ from .cache import ImageCache
 from .models import MediaItem
 
 
+def _render_placeholder(
+    w: int, h: int, top: QtGui.QColor, bottom: QtGui.QColor, border: QtGui.QColor,
+    radius: int, text_color: QtGui.QColor, font: QtGui.QFont, text: str,
+) -> QtGui.QPixmap:
+    pm = QtGui.QPixmap(w, h)
+    pm.fill(Qt.transparent)
+    p = QtGui.QPainter(pm)
+    p.setRenderHint(QtGui.QPainter.Antialiasing)
+    rect = pm.rect().adjusted(1, 1, -1, -1)
+    grad = QtGui.QLinearGradient(rect.topLeft(), rect.bottomRight())
+    grad.setColorAt(0.0, top)
+    grad.setColorAt(1.0, bottom)
+    p.setBrush(QtGui.QBrush(grad))
+    p.setPen(QtGui.QPen(border, 1))
+    p.drawRoundedRect(rect, radius, radius)
+    p.setPen(text_color)
+    p.setFont(font)
+    p.drawText(rect, Qt.AlignCenter, text)
+    p.end()
+    return pm
+
+
+# QPixmap is implicitly shared, so every card can hold the same placeholder.
+@functools.lru_cache(maxsize=8)
+def thumb_placeholder(w: int, h: int) -> QtGui.QPixmap:
+    return _render_placeholder(
+        w, h,
+        QtGui.QColor(45, 52, 64), QtGui.QColor(22, 26, 33), QtGui.QColor(70, 80, 96), 10,
+        QtGui.QColor(150, 160, 180), QtGui.QFont("Inter", 9), "No\nImage",
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def detail_placeholder(w: int, h: int) -> QtGui.QPixmap:
+    return _render_placeholder(
+        w, h,
+        QtGui.QColor(60, 74, 95), QtGui.QColor(20, 24, 35), QtGui.QColor(90, 105, 130), 16,
+        QtGui.QColor(170, 185, 210), QtGui.QFont("Inter", 10, 700), "Cover",
+    )
+
+
 class Pill(QtWidgets.QLabel):
     def __init__(self, text: str, kind: str = "neutral"):
         super().__init__(text)
@@ -17,6 +61,31 @@ class Pill(QtWidgets.QLabel):
 
 
 class MediaCard(QtWidgets.QFrame):
+    """One list row, painted directly instead of through a layout of labels.
+
+    The stylesheet still draws the card background and hover state; the thumb,
+    title, badge, subtitle and meta line are positioned in ``resizeEvent`` and
+    drawn in ``paintEvent``.
+    """
+
+    THUMB_SIZE = QtCore.QSize(60, 84)
+    MARGIN = 10
+    SPACING = 10
+    LINE_SPACING = 4
+    BADGE_HEIGHT = 22
+    BADGE_PADDING = 10
+    THUMB_RADIUS = 12
+
+    TEXT_COLOR = QtGui.QColor(234, 240, 255)
+    SUB_COLOR = QtGui.QColor(234, 240, 255, 184)
+    META_COLOR = QtGui.QColor(234, 240, 255, 158)
+    THUMB_BG = QtGui.QColor(0, 0, 0, 64)
+    THUMB_BORDER = QtGui.QColor(255, 255, 255, 18)
+    BADGE_COLORS = {
+        "anime": (QtGui.QColor(110, 145, 255, 46), QtGui.QColor(110, 145, 255, 77)),
+        "manga": (QtGui.QColor(140, 91, 255, 46), QtGui.QColor(140, 91, 255, 77)),
+    }
+
     def __init__(self, item: MediaItem, img_cache: ImageCache):
         super().__init__()
         self.item = item
@@ -25,84 +94,233 @@ class MediaCard(QtWidgets.QFrame):
         self.setObjectName("MediaCard")
         self.setFrameShape(QtWidgets.QFrame.NoFrame)
 
-        root = QtWidgets.QHBoxLayout(self)
-        root.setContentsMargins(10, 10, 10, 10)
-        root.setSpacing(10)
+        self._title = item.title
+        self._subtitle = item.title_native or ""
+        self._meta = f"{item.publication_day} • {item.country} • {item.language} • {item.format} • {item.status}"
+        self._badge = item.media_type
+        self._badge_kind = "anime" if item.media_type == "ANIME" else "manga"
 
-        self.thumb = QtWidgets.QLabel()
-        self.thumb.setObjectName("Thumb")
-        self.thumb.setFixedSize(60, 84)
-        self.thumb.setAlignment(Qt.AlignCenter)
-        self.thumb.setScaledContents(True)
+        self._thumb_rect = QtCore.QRect(QtCore.QPoint(self.MARGIN, self.MARGIN), self.THUMB_SIZE)
+        self._thumb_path = QtGui.QPainterPath()
+        self._thumb_path.addRoundedRect(QtCore.QRectF(self._thumb_rect), self.THUMB_RADIUS, self.THUMB_RADIUS)
+        self._title_rect = self._badge_rect = self._sub_rect = self._meta_rect = QtCore.QRect()
+        self._title_elided = self._sub_elided = self._meta_elided = ""
+        self._update_fonts()
 
         self._set_placeholder()
 
-        mid = QtWidgets.QVBoxLayout()
-        mid.setContentsMargins(0, 0, 0, 0)
-        mid.setSpacing(4)
+        if item.image_url_thumb:
+            self.img_cache.request(item.image_url_thumb, self.THUMB_SIZE)
+            self.update_image_if_ready()
 
-        title_row = QtWidgets.QHBoxLayout()
-        title_row.setContentsMargins(0, 0, 0, 0)
-        title_row.setSpacing(8)
+    def sizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(10, 106)
 
-        self.title = QtWidgets.QLabel(item.title)
-        self.title.setObjectName("CardTitle")
-        self.title.setWordWrap(False)
-        self.title.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+    def _set_placeholder(self):
+        self._thumb_pix = thumb_placeholder(self.THUMB_SIZE.width(), self.THUMB_SIZE.height())
 
-        kind = "anime" if item.media_type == "ANIME" else "manga"
-        self.badge = Pill(item.media_type, kind)
+    def update_image_if_ready(self):
+        url = self.item.image_url_thumb
+        if not url:
+            return
+        pix = self.img_cache.get_scaled(url, self.THUMB_SIZE)
+        if not pix:
+            return
+        self._thumb_pix = pix
+        self.update(self._thumb_rect)
 
-        title_row.addWidget(self.title, 1)
-        title_row.addWidget(self.badge, 0)
+    def _update_fonts(self):
+        # Derived from the widget font, so rebuilt only when the (stylesheet) font changes.
+        self._base_font = QtGui.QFont(self.font())
+        self._title_font = QtGui.QFont(self._base_font)
+        # The old `#CardTitle { font-size: 13.5px }` rule resolved to 14px.
+        self._title_font.setPixelSize(14)
+        self._title_font.setWeight(QtGui.QFont.Bold)
+        self._badge_font = QtGui.QFont(self._base_font)
+        self._badge_font.setWeight(QtGui.QFont.Bold)
+        self._fm = QtGui.QFontMetrics(self._base_font)
+        self._fm_title = QtGui.QFontMetrics(self._title_font)
+        self._fm_badge = QtGui.QFontMetrics(self._badge_font)
 
-        meta = QtWidgets.QLabel(
-            f"{item.publication_day} • {item.country} • {item.language} • {item.format} • {item.status}"
-        )
-        meta.setObjectName("CardMeta")
-        meta.setWordWrap(False)
-        meta.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+    def changeEvent(self, e: QtCore.QEvent):
+        super().changeEvent(e)
+        if e.type() in (QtCore.QEvent.FontChange, QtCore.QEvent.StyleChange):
+            self._update_fonts()
+            self._relayout()
+            self.update()
 
-        self.subtitle = QtWidgets.QLabel(item.title_native or "")
-        self.subtitle.setObjectName("CardSub")
-        self.subtitle.setWordWrap(False)
-        self.subtitle.setVisible(bool(item.title_native))
+    def _relayout(self):
+        # Geometry only depends on the width and fonts, so it is computed here
+        # rather than on every paint.
+        fm, fm_title, fm_badge = self._fm, self._fm_title, self._fm_badge
 
-        mid.addLayout(title_row)
-        if item.title_native:
-            mid.addWidget(self.subtitle)
-        mid.addWidget(meta)
+        x = self._thumb_rect.right() + 1 + self.SPACING
+        right = self.width() - self.MARGIN
+        text_w = max(0, right - x)
 
-        root.addWidget(self.thumb, 0)
-        root.addLayout(mid, 1)
+        badge_w = fm_badge.horizontalAdvance(self._badge) + 2 * self.BADGE_PADDING
+        title_h = max(fm_title.height(), self.BADGE_HEIGHT)
+        lines = [title_h, fm.height()] if not self._subtitle else [title_h, fm.height(), fm.height()]
+        block_h = sum(lines) + self.LINE_SPACING * (len(lines) - 1)
+        y = self.MARGIN + max(0, (self.height() - 2 * self.MARGIN - block_h) // 2)
 
-        if item.image_url:
-            self.img_cache.request(item.image_url)
+        self._badge_rect = QtCore.QRect(right - badge_w, y + (title_h - self.BADGE_HEIGHT) // 2, badge_w, self.BADGE_HEIGHT)
+        title_w = max(0, self._badge_rect.left() - 8 - x)
+        self._title_rect = QtCore.QRect(x, y, title_w, title_h)
+        self._title_elided = fm_title.elidedText(self._title, Qt.ElideRight, title_w)
+        y += title_h + self.LINE_SPACING
 
-    def _set_placeholder(self):
-        pm = QtGui.QPixmap(self.thumb.size())
-        pm.fill(Qt.transparent)
-        p = QtGui.QPainter(pm)
+        if self._subtitle:
+            self._sub_rect = QtCore.QRect(x, y, text_w, fm.height())
+            self._sub_elided = fm.elidedText(self._subtitle, Qt.ElideRight, text_w)
+            y += fm.height() + self.LINE_SPACING
+
+        self._meta_rect = QtCore.QRect(x, y, text_w, fm.height())
+        self._meta_elided = fm.elidedText(self._meta, Qt.ElideRight, text_w)
+
+    def resizeEvent(self, e: QtGui.QResizeEvent):
+        super().resizeEvent(e)
+        self._relayout()
+
+    def paintEvent(self, e: QtGui.QPaintEvent):
+        super().paintEvent(e)
+
+        p = QtGui.QPainter(self)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+        p.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+
+        if e.rect().intersects(self._thumb_rect):
+            p.fillPath(self._thumb_path, self.THUMB_BG)
+            p.save()
+            p.setClipPath(self._thumb_path)
+            p.drawPixmap(self._thumb_rect, self._thumb_pix)
+            p.restore()
+            p.setPen(QtGui.QPen(self.THUMB_BORDER, 1))
+            p.setBrush(Qt.NoBrush)
+            p.drawPath(self._thumb_path)
+
+        bg, border = self.BADGE_COLORS[self._badge_kind]
+        radius = self.BADGE_HEIGHT / 2
+        p.setPen(QtGui.QPen(border, 1))
+        p.setBrush(bg)
+        p.drawRoundedRect(QtCore.QRectF(self._badge_rect).adjusted(0.5, 0.5, -0.5, -0.5), radius, radius)
+        p.setPen(self.TEXT_COLOR)
+        p.setFont(self._badge_font)
+        p.drawText(self._badge_rect, Qt.AlignCenter, self._badge)
+
+        flags = Qt.AlignLeft | Qt.AlignVCenter | Qt.TextSingleLine
+        p.setFont(self._title_font)
+        p.drawText(self._title_rect, flags, self._title_elided)
+
+        p.setFont(self._base_font)
+        if self._subtitle:
+            p.setPen(self.SUB_COLOR)
+            p.drawText(self._sub_rect, flags, self._sub_elided)
+        p.setPen(self.META_COLOR)
+        p.drawText(self._meta_rect, flags, self._meta_elided)
+        p.end()
+
+
+class MediaList(QtWidgets.QListWidget):
+    """QListWidget that paints a pre-rendered drop shadow under every row.
+
+    A QGraphicsDropShadowEffect per card re-blurs the card on each repaint;
+    here the blurred rounded rect is rendered once and stretched as a
+    9-slice under each visible row before the rows themselves are painted.
+    """
+
+    SHADOW_BLUR = 18
+    SHADOW_RADIUS = 18
+    SHADOW_OFFSET = QtCore.QPoint(0, 8)
+    SHADOW_COLOR = QtGui.QColor(0, 0, 0, 120)
+
+    _shadow: Optional[QtGui.QPixmap] = None
+
+    @classmethod
+    def _get_shadow(cls) -> QtGui.QPixmap:
+        if cls._shadow is not None:
+            return cls._shadow
+
+        blur, radius = cls.SHADOW_BLUR, cls.SHADOW_RADIUS
+        core = 2 * radius + 2
+        size = core + 2 * blur
+
+        src = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+        src.fill(Qt.transparent)
+        p = QtGui.QPainter(src)
         p.setRenderHint(QtGui.QPainter.Antialiasing)
-        rect = pm.rect().adjusted(1, 1, -1, -1)
-        grad = QtGui.QLinearGradient(rect.topLeft(), rect.bottomRight())
-        grad.setColorAt(0.0, QtGui.QColor(45, 52, 64))
-        grad.setColorAt(1.0, QtGui.QColor(22, 26, 33))
-        p.setBrush(QtGui.QBrush(grad))
-        p.setPen(QtGui.QPen(QtGui.QColor(70, 80, 96), 1))
-        p.drawRoundedRect(rect, 10, 10)
-        p.setPen(QtGui.QColor(150, 160, 180))
-        p.setFont(QtGui.QFont("Inter", 9))
-        p.drawText(rect, Qt.AlignCenter, "No\nImage")
+        p.setPen(Qt.NoPen)
+        p.setBrush(cls.SHADOW_COLOR)
+        p.drawRoundedRect(QtCore.QRectF(blur, blur, core, core), radius, radius)
         p.end()
-        self.thumb.setPixmap(pm)
 
-    def update_image_if_ready(self):
-        url = self.item.image_url
-        if not url:
-            return
-        pix = self.img_cache.get(url)
-        if not pix:
-            return
-        scaled = pix.scaled(self.thumb.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        self.thumb.setPixmap(scaled)
+        scene = QtWidgets.QGraphicsScene()
+        item = QtWidgets.QGraphicsPixmapItem(QtGui.QPixmap.fromImage(src))
+        eff = QtWidgets.QGraphicsBlurEffect()
+        eff.setBlurRadius(blur)
+        item.setGraphicsEffect(eff)
+        scene.addItem(item)
+
+        out = QtGui.QImage(size, size, QtGui.QImage.Format_ARGB32_Premultiplied)
+        out.fill(Qt.transparent)
+        p = QtGui.QPainter(out)
+        scene.render(p, QtCore.QRectF(0, 0, size, size), QtCore.QRectF(0, 0, size, size))
+        p.end()
+
+        cls._shadow = QtGui.QPixmap.fromImage(out)
+        return cls._shadow
+
+    @staticmethod
+    def _draw_nine_slice(p: QtGui.QPainter, target: QtCore.QRect, pix: QtGui.QPixmap, m: int):
+        sw, sh = pix.width(), pix.height()
+        tw, th = target.width(), target.height()
+        xs = ((0, m, 0, m), (m, sw - 2 * m, m, tw - 2 * m), (sw - m, m, tw - m, m))
+        ys = ((0, m, 0, m), (m, sh - 2 * m, m, th - 2 * m), (sh - m, m, th - m, m))
+        for sx, sw_, tx, tw_ in xs:
+            for sy, sh_, ty, th_ in ys:
+                if tw_ <= 0 or th_ <= 0:
+                    continue
+                p.drawPixmap(
+                    QtCore.QRect(target.x() + tx, target.y() + ty, tw_, th_),
+                    pix,
+                    QtCore.QRect(sx, sy, sw_, sh_),
+                )
+
+    def rows_between(self, top: int, bottom: int) -> Iterator[int]:
+        """Yield non-hidden rows from the one at viewport y `top` until a row starts below `bottom`."""
+        x = self.viewport().rect().center().x()
+        first = self.indexAt(QtCore.QPoint(x, top))
+        if not first.isValid():
+            # `top` may fall into the spacing between two rows.
+            first = self.indexAt(QtCore.QPoint(x, top + 2 * self.spacing() + 1))
+        if first.isValid():
+            start = first.row()
+        else:
+            # `top` may also lie above the first row (the list's top margin at
+            # scroll 0); start from the first shown row if it begins below `top`.
+            start = next((r for r in range(self.count()) if not self.item(r).isHidden()), None)
+            if start is None or self.visualItemRect(self.item(start)).top() < top:
+                return
+        for row in range(start, self.count()):
+            lw_item = self.item(row)
+            if lw_item.isHidden():
+                continue
+            if self.visualItemRect(lw_item).top() > bottom:
+                return
+            yield row
+
+    def paintEvent(self, e: QtGui.QPaintEvent):
+        area = e.rect()
+        pad = self.SHADOW_BLUR + abs(self.SHADOW_OFFSET.y())
+        shadow = self._get_shadow()
+        m = self.SHADOW_BLUR + self.SHADOW_RADIUS
+
+        p = QtGui.QPainter(self.viewport())
+        for row in self.rows_between(area.top() - pad, area.bottom() + pad):
+            rect = self.visualItemRect(self.item(row)).translated(self.SHADOW_OFFSET)
+            target = rect.adjusted(-self.SHADOW_BLUR, -self.SHADOW_BLUR, self.SHADOW_BLUR, self.SHADOW_BLUR)
+            if target.intersects(area):
+                self._draw_nine_slice(p, target, shadow, m)
+        p.end()
+
+        super().paintEvent(e)
@@ -3,17 +3,22 @@ from __future__ import annotations
 
 import datetime as dt
 import sys
+from collections import defaultdict
+from typing import Dict, List, Optional
 
-from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6 import QtCore, QtGui, QtNetwork, QtWidgets
 from PySide6.QtCore import Qt, QUrl
 
 from .cache import ImageCache
-from .widgets import MediaCard, Pill
+from .widgets import MediaCard, MediaList, Pill, detail_placeholder
 from .workers import FetchWorker
 from .models import MediaItem
 
 
 class Window(QtWidgets.QMainWindow):
+    CARD_OVERSCAN_PX = 240
+    CARD_BATCH = 8
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("MAApp")
@@ -23,8 +28,11 @@ class Window(QtWidgets.QMainWindow):
         self.img_cache.image_ready.connect(self._on_image_ready)
 
         self._items: List[MediaItem] = []
-        self._worker_thread: Optional[QtCore.QThread] = None
+        self._items_haystack: List[str] = []
+        self._items_by_type: Dict[str, List[int]] = {}
+        self._url_to_cards: Dict[str, List[MediaCard]] = defaultdict(list)
         self._worker: Optional[FetchWorker] = None
+        self._net = QtNetwork.QNetworkAccessManager(self)
 
         self._build_ui()
         self._apply_style()
@@ -137,7 +145,12 @@ class Window(QtWidgets.QMainWindow):
         self.search = QtWidgets.QLineEdit()
         self.search.setPlaceholderText("Search title…")
         self.search.setObjectName("SearchBox")
-        self.search.textChanged.connect(self._rebuild_list)
+
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._refilter_list)
+        self.search.textChanged.connect(lambda _=None: self._search_timer.start())
 
         self.count = QtWidgets.QLabel("0 items")
         self.count.setObjectName("CountLabel")
@@ -148,7 +161,7 @@ class Window(QtWidgets.QMainWindow):
 
         ll.addLayout(top_row)
 
-        self.listw = QtWidgets.QListWidget()
+        self.listw = MediaList()
         self.listw.setObjectName("MediaList")
         self.listw.setSpacing(10)
         self.listw.setUniformItemSizes(False)
@@ -156,6 +169,15 @@ class Window(QtWidgets.QMainWindow):
         self.listw.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
         self.listw.currentRowChanged.connect(self._on_selected_row)
 
+        # Cards are created lazily for rows in (or just below) the viewport.
+        self._card_timer = QtCore.QTimer(self)
+        self._card_timer.setSingleShot(True)
+        self._card_timer.setInterval(0)
+        self._card_timer.timeout.connect(self._materialize_visible_cards)
+        self.listw.verticalScrollBar().valueChanged.connect(lambda _=None: self._card_timer.start())
+        self.listw.verticalScrollBar().rangeChanged.connect(lambda *_: self._card_timer.start())
+        self.listw.viewport().installEventFilter(self)
+
         ll.addWidget(self.listw, 1)
 
         self.progress = QtWidgets.QProgressBar()
@@ -313,10 +335,6 @@ class Window(QtWidgets.QMainWindow):
 
             #MediaCard { border-radius: 18px; background: rgba(255,255,255,0.06); border: 1px solid rgba(255,255,255,0.08); }
             #MediaCard:hover { background: rgba(255,255,255,0.08); border-color: rgba(110,145,255,0.22); }
-            #Thumb { border-radius: 12px; background: rgba(0,0,0,0.25); border: 1px solid rgba(255,255,255,0.07); }
-            #CardTitle { font-size: 13.5px; font-weight: 700; }
-            #CardSub { color: rgba(234,240,255,0.72); }
-            #CardMeta { color: rgba(234,240,255,0.62); }
 
             QLabel#pill_neutral { border-radius: 11px; background: rgba(255,255,255,0.07); border: 1px solid rgba(255,255,255,0.10); font-weight: 600; }
             QLabel#pill_anime { border-radius: 11px; background: rgba(110,145,255,0.18); border: 1px solid rgba(110,145,255,0.30); font-weight: 700; }
@@ -388,44 +406,32 @@ class Window(QtWidgets.QMainWindow):
         self.progress.setVisible(True)
         self.progress.setRange(0, 0)
 
-        self._worker_thread = QtCore.QThread(self)
-        self._worker = FetchWorker(date_from=date_from, date_to=date_to)
-        self._worker.moveToThread(self._worker_thread)
-
-        self._worker_thread.started.connect(self._worker.run)
+        self._worker = FetchWorker(date_from=date_from, date_to=date_to, manager=self._net, parent=self)
         self._worker.finished.connect(self._on_fetched)
         self._worker.error.connect(self._on_fetch_error)
 
-        self._worker.finished.connect(self._worker_thread.quit)
-        self._worker.error.connect(self._worker_thread.quit)
-        self._worker_thread.finished.connect(self._cleanup_worker)
+        self._worker.finished.connect(self._cleanup_worker)
+        self._worker.error.connect(self._cleanup_worker)
 
-        self._worker_thread.start()
+        self._worker.start()
 
     def _stop_worker_if_any(self):
         if self._worker:
             self._worker.abort()
-        if self._worker_thread and self._worker_thread.isRunning():
-            self._worker_thread.quit()
-            self._worker_thread.wait(500)
+        self._cleanup_worker()
 
     def _cleanup_worker(self):
         if self._worker:
             self._worker.deleteLater()
-        if self._worker_thread:
-            self._worker_thread.deleteLater()
         self._worker = None
-        self._worker_thread = None
 
     def _on_fetched(self, items: list):
         self._items = list(items)
-        self._rebuild_list()
+        self._populate_list()
         self.btn_download.setEnabled(True)
         self.progress.setVisible(False)
         self.progress.setRange(0, 1)
         self.status.setText(f"Loaded {len(self._items)} items.")
-        if self.listw.count() > 0:
-            self.listw.setCurrentRow(0)
 
     def _on_fetch_error(self, msg: str):
         self.btn_download.setEnabled(True)
@@ -439,48 +445,67 @@ class Window(QtWidgets.QMainWindow):
         self.filter_all.setChecked(mode == "ALL")
         self.filter_anime.setChecked(mode == "ANIME")
         self.filter_manga.setChecked(mode == "MANGA")
-        self._rebuild_list()
+        self._refilter_list()
 
-    def _passes_filter(self, it: MediaItem) -> bool:
-        return True if self._filter_mode == "ALL" else it.media_type == self._filter_mode
-
-    def _passes_search(self, it: MediaItem) -> bool:
-        q = self.search.text().strip().lower()
-        if not q:
-            return True
-        return q in it.title.lower() or (it.title_native and q in it.title_native.lower())
-
-    def _rebuild_list(self):
+    def _populate_list(self):
         self.listw.blockSignals(True)
         self.listw.clear()
+        self._url_to_cards.clear()
 
-        filtered = [it for it in self._items if self._passes_filter(it) and self._passes_search(it)]
-        self.count.setText(f"{len(filtered)} items")
+        # "\x1f" keeps a query from matching across the title/native boundary.
+        self._items_haystack = [f"{it.title_lc}\x1f{it.title_native_lc}" for it in self._items]
+        self._items_by_type = {}
+        for row, it in enumerate(self._items):
+            self._items_by_type.setdefault(it.media_type, []).append(row)
 
-        for it in filtered:
+        for it in self._items:
             lw_item = QtWidgets.QListWidgetItem()
             lw_item.setData(Qt.UserRole, it)
-
-            card = MediaCard(it, self.img_cache)
-            self._add_card_shadow(card)
-
             lw_item.setSizeHint(QtCore.QSize(10, 106))
             self.listw.addItem(lw_item)
-            self.listw.setItemWidget(lw_item, card)
 
         self.listw.blockSignals(False)
+        self._refilter_list()
+
+    def _materialize_visible_cards(self):
+        lw = self.listw
+        vp = lw.viewport().rect()
+        built = 0
+        for row in lw.rows_between(vp.top(), vp.bottom() + self.CARD_OVERSCAN_PX):
+            lw_item = lw.item(row)
+            if lw.itemWidget(lw_item) is None:
+                if built == self.CARD_BATCH:
+                    # Let the event loop paint what exists, then continue.
+                    self._card_timer.start()
+                    return
+                built += 1
+                card = MediaCard(lw_item.data(Qt.UserRole), self.img_cache)
+                if card.item.image_url_thumb:
+                    self._url_to_cards[card.item.image_url_thumb].append(card)
+                lw.setItemWidget(lw_item, card)
+
+    def _refilter_list(self):
+        # Cards are built once per fetch; searching and filtering only hide rows.
+        q = self.search.text().strip().lower()
+        if self._filter_mode == "ALL":
+            rows = range(len(self._items))
+        else:
+            rows = self._items_by_type.get(self._filter_mode, [])
+        haystack = self._items_haystack
+        visible = [row for row in rows if q in haystack[row]] if q else list(rows)
+
+        shown_rows = set(visible)
+        for row in range(self.listw.count()):
+            self.listw.item(row).setHidden(row not in shown_rows)
 
-        if self.listw.count() == 0:
+        self.count.setText(f"{len(visible)} items")
+        self._card_timer.start()
+
+        if not visible:
+            self.listw.setCurrentRow(-1)
             self._show_detail(None)
         else:
-            self.listw.setCurrentRow(0)
-
-    def _add_card_shadow(self, card: QtWidgets.QWidget):
-        eff = QtWidgets.QGraphicsDropShadowEffect(self)
-        eff.setBlurRadius(18)
-        eff.setOffset(0, 8)
-        eff.setColor(QtGui.QColor(0, 0, 0, 120))
-        card.setGraphicsEffect(eff)
+            self.listw.setCurrentRow(visible[0])
 
     def _on_selected_row(self, row: int):
         if row < 0:
@@ -494,22 +519,8 @@ class Window(QtWidgets.QMainWindow):
         self._show_detail(it if isinstance(it, MediaItem) else None)
 
     def _set_detail_placeholder(self):
-        pm = QtGui.QPixmap(self.detail_img.size())
-        pm.fill(Qt.transparent)
-        p = QtGui.QPainter(pm)
-        p.setRenderHint(QtGui.QPainter.Antialiasing)
-        rect = pm.rect().adjusted(1, 1, -1, -1)
-        grad = QtGui.QLinearGradient(rect.topLeft(), rect.bottomRight())
-        grad.setColorAt(0.0, QtGui.QColor(60, 74, 95))
-        grad.setColorAt(1.0, QtGui.QColor(20, 24, 35))
-        p.setBrush(QtGui.QBrush(grad))
-        p.setPen(QtGui.QPen(QtGui.QColor(90, 105, 130), 1))
-        p.drawRoundedRect(rect, 16, 16)
-        p.setPen(QtGui.QColor(170, 185, 210))
-        p.setFont(QtGui.QFont("Inter", 10, 700))
-        p.drawText(rect, Qt.AlignCenter, "Cover")
-        p.end()
-        self.detail_img.setPixmap(pm)
+        size = self.detail_img.size()
+        self.detail_img.setPixmap(detail_placeholder(size.width(), size.height()))
 
     def _show_detail(self, it: Optional[MediaItem]):
         self._current_item = it
@@ -551,25 +562,21 @@ class Window(QtWidgets.QMainWindow):
         self.btn_copy.setEnabled(bool(it.site_url))
 
         if it.image_url:
-            self.img_cache.request(it.image_url)
+            self.img_cache.request(it.image_url, self.detail_img.size())
             self._update_detail_image_if_ready()
 
     def _update_detail_image_if_ready(self):
         it = self._current_item
         if not it or not it.image_url:
             return
-        pix = self.img_cache.get(it.image_url)
+        pix = self.img_cache.get_scaled(it.image_url, self.detail_img.size())
         if not pix:
             return
-        scaled = pix.scaled(self.detail_img.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-        self.detail_img.setPixmap(scaled)
+        self.detail_img.setPixmap(pix)
 
     def _on_image_ready(self, url: str):
-        for i in range(self.listw.count()):
-            lw_item = self.listw.item(i)
-            w = self.listw.itemWidget(lw_item)
-            if isinstance(w, MediaCard) and w.item.image_url == url:
-                w.update_image_if_ready()
+        for card in self._url_to_cards.get(url, ()):
+            card.update_image_if_ready()
 
         it = self._current_item
         if it and it.image_url == url:
@@ -587,6 +594,11 @@ class Window(QtWidgets.QMainWindow):
         QtWidgets.QApplication.clipboard().setText(it.site_url)
         self.status.setText("Link copied to clipboard.")
 
+    def eventFilter(self, obj: QtCore.QObject, e: QtCore.QEvent) -> bool:
+        if obj is self.listw.viewport() and e.type() == QtCore.QEvent.Resize:
+            self._card_timer.start()
+        return super().eventFilter(obj, e)
+
     def closeEvent(self, e: QtGui.QCloseEvent):
         self._stop_worker_if_any()
         super().closeEvent(e)
@@ -1,46 +1,102 @@
 from __future__ import annotations
 
 import datetime as dt
+from operator import attrgetter
+from typing import List, Optional, Set
 
-from PySide6 import QtCore
+from PySide6 import QtCore, QtNetwork
+from PySide6.QtCore import QUrl
 
 from .anilist import AniListClient
-from .utils import yyyymmdd_int
+from .models import MediaItem
+from .utils import ANILIST_GQL
 
 
 class FetchWorker(QtCore.QObject):
     finished = QtCore.Signal(list)  # List[MediaItem]
     error = QtCore.Signal(str)
 
-    def __init__(self, date_from: dt.date, date_to: dt.date):
-        super().__init__()
+    def __init__(
+        self,
+        date_from: dt.date,
+        date_to: dt.date,
+        manager: Optional[QtNetwork.QNetworkAccessManager] = None,
+        parent: Optional[QtCore.QObject] = None,
+    ):
+        super().__init__(parent)
         self.date_from = date_from
         self.date_to = date_to
         self._abort = False
+        self._client = AniListClient(timeout=25)
+        # Pass a long-lived manager to keep the AniList connection (and TLS
+        # session) alive across downloads.
+        self._manager = manager if manager is not None else QtNetwork.QNetworkAccessManager(self)
+        self._reply: Optional[QtNetwork.QNetworkReply] = None
+        self._payload = b""
+        self._ttl: Optional[dt.timedelta] = None
 
-    @QtCore.Slot()
-    def run(self):
-        try:
-            client = AniListClient(timeout=25)
-            if self._abort:
-                return
-            anime = client.fetch_new("ANIME", self.date_from, self.date_to, per_page=40)
-            if self._abort:
-                return
-            manga = client.fetch_new("MANGA", self.date_from, self.date_to, per_page=40)
-            if self._abort:
+    def start(self):
+        self._payload = self._client.build_payload(self.date_from, self.date_to, per_page=40)
+        self._ttl = self._client.cache_ttl(self.date_to)
+        body = self._client.load_cached(self._payload, self._ttl) if self._ttl is not None else None
+        if body is not None:
+            try:
+                anime, manga = self._client.parse_response(200, body)
+            except Exception:
+                pass
+            else:
+                QtCore.QTimer.singleShot(0, self, lambda: self._emit_items(anime, manga))
                 return
 
-            items = anime + manga
-            uniq = {}
-            for it in items:
-                uniq[(it.media_type, it.id)] = it
-            items = list(uniq.values())
+        req = QtNetwork.QNetworkRequest(QUrl(ANILIST_GQL))
+        for name, value in AniListClient.HEADERS.items():
+            req.setRawHeader(name.encode(), value.encode())
+        req.setTransferTimeout(self._client.timeout * 1000)
+        req.setAttribute(QtNetwork.QNetworkRequest.Http2AllowedAttribute, True)
+
+        self._reply = self._manager.post(req, self._payload)
+        self._reply.finished.connect(self._on_finished)
 
-            items.sort(key=lambda x: (x.key_date, x.media_type, x.title.lower()), reverse=True)
-            self.finished.emit(items)
+    @QtCore.Slot()
+    def _on_finished(self):
+        reply, self._reply = self._reply, None
+        if not reply:
+            return
+        reply.deleteLater()
+        if self._abort:
+            return
+
+        status = reply.attribute(QtNetwork.QNetworkRequest.HttpStatusCodeAttribute)
+        body = bytes(reply.readAll())
+        try:
+            if status is None:
+                raise RuntimeError(reply.errorString())
+            anime, manga = self._client.parse_response(int(status), body)
         except Exception as e:
             self.error.emit(str(e))
+            return
+
+        if self._ttl is not None:
+            self._client.store_cached(self._payload, body)
+        self._emit_items(anime, manga)
+
+    def _emit_items(self, anime: list, manga: list):
+        if self._abort:
+            return
+        # Anime and manga ids live in separate namespaces, so only repeats
+        # within one media type need dropping.
+        items: List[MediaItem] = []
+        for part in (anime, manga):
+            seen: Set[int] = set()
+            for it in part:
+                if it.id not in seen:
+                    seen.add(it.id)
+                    items.append(it)
+
+        items.sort(key=attrgetter("sort_key"), reverse=True)
+        self.finished.emit(items)
 
     def abort(self):
         self._abort = True
+        if self._reply:
+            self._reply.abort()